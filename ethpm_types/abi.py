@@ -1,6 +1,9 @@
-from typing import TYPE_CHECKING, Literal, Optional, Union
+import sys
+from collections.abc import Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Optional, Union
 
-from pydantic import ConfigDict, Field
+from pydantic import AfterValidator, ConfigDict, Field
 
 from ethpm_types.base import BaseModel
 from ethpm_types.utils import parse_signature
@@ -8,6 +11,10 @@ from ethpm_types.utils import parse_signature
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+# NOTE: Type names and state mutabilities repeat across every ABI in a manifest.
+#   Interning them lets all entries share the same string objects.
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
 
 class ABIType(BaseModel):
     name: Optional[str] = None
@@ -16,7 +23,7 @@ class ABIType(BaseModel):
     a function.
     """
 
-    type: Union[str, "ABIType"]
+    type: Union[_InternedStr, "ABIType"]
     """
     The value-type, such as ``address`` or ``address[]``.
     """
@@ -27,7 +34,7 @@ class ABIType(BaseModel):
     Tuples and structs tend to have this field.
     """
 
-    internal_type: Optional[str] = Field(default=None, alias="internalType")
+    internal_type: Optional[_InternedStr] = Field(default=None, alias="internalType")
     """
     Another name for the type. Sometimes, compilers are able to populate
     this field with the struct or enum name.
@@ -35,7 +42,20 @@ class ABIType(BaseModel):
 
     model_config = ConfigDict(frozen=True, extra="allow")
 
-    @property
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Self":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # NOTE: The copy starts with this type's cached properties.
+            copied.__dict__.pop("canonical_type", None)
+            copied.__dict__.pop("signature", None)
+
+        return copied
+
+    # NOTE: ABI types are frozen, so the properties below are computed once.
+    #   Nested components cache their own values, so tuples are only walked once.
+    @cached_property
     def canonical_type(self) -> str:
         """
         The low-level type recognized by the virtual machine.
@@ -43,21 +63,25 @@ class ABIType(BaseModel):
         of its components.
         """
 
-        if "tuple" in self.type and self.components:  # NOTE: 2nd condition just to satisfy mypy
-            value = f"({','.join(m.canonical_type for m in self.components)})"
-            if "[" in self.type:
-                value += f"[{str(self.type).split('[')[-1]}"
+        node = self
+        while not isinstance(node.type, str):
+            # NOTE: A nested type's canonical type is that of its innermost type.
+            node = node.type
 
-            return value
+        abi_type = node.type
+        if not node.components or not abi_type.startswith("tuple"):
+            return abi_type
 
-        elif isinstance(self.type, str):
-            return self.type
+        value = f"({','.join([m.canonical_type for m in node.components])})"
+        if (array_index := abi_type.find("[")) != -1:
+            # NOTE: Keep every array dimension, e.g. `tuple[2][]` -> `(...)[2][]`.
+            value += abi_type[array_index:]
 
-        else:
-            # Recursively discover the canonical type
-            return self.type.canonical_type
+        # NOTE: Plain types are interned on validation; intern the built tuple
+        #   types too so identical structs across ABIs share one string.
+        return sys.intern(value)
 
-    @property
+    @cached_property
     def signature(self) -> str:
         """
         If the type has name, returns ``"<canonical_type> <name>"``.
@@ -78,7 +102,7 @@ class EventABIType(ABIType):
     **NOTE**: Only event ABI types should have this field
     """
 
-    @property
+    @cached_property
     def signature(self) -> str:
         """
         The event signature.
@@ -109,7 +133,7 @@ class ConstructorABI(BaseABI):
     type: Literal["constructor"] = "constructor"
     """The value ``"constructor"``."""
 
-    stateMutability: str = "nonpayable"
+    stateMutability: _InternedStr = "nonpayable"
     """
     Can be either ``"payable"`` or ``"nonpayable"``.
     Defaults to the value ``"nonpayable"``.
@@ -157,7 +181,7 @@ class FallbackABI(BaseABI):
     type: Literal["fallback"] = "fallback"
     """The value ``"fallback"``."""
 
-    stateMutability: str = "nonpayable"
+    stateMutability: _InternedStr = "nonpayable"
     """
     Can be either ``"payable"`` or ``"nonpayable"``.
     Defaults to the value ``"nonpayable"``.
@@ -220,7 +244,7 @@ class MethodABI(BaseABI):
     name: str
     """The name of the method."""
 
-    stateMutability: str = "nonpayable"
+    stateMutability: _InternedStr = "nonpayable"
     """
     Can be either ``"payable"`` or ``"nonpayable"``.
     Defaults to the value ``"nonpayable"``.
@@ -1,6 +1,7 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from enum import Enum
-from typing import Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from pydantic import model_validator
 
@@ -8,6 +9,9 @@ from ethpm_types.base import BaseModel
 from ethpm_types.sourcemap import SourceMapItem
 from ethpm_types.utils import SourceLocation
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 class ASTClassification(Enum):
     UNCLASSIFIED = 0
@@ -76,10 +80,13 @@ class ASTNode(BaseModel):
         if "nodeType" in val and "ast_type" not in val:
             val["ast_type"] = val.pop("nodeType")
 
+        # NOTE: Serialized nodes already have their `children`; those get validated
+        #   by the field itself, so only search raw compiler output for them.
+        children = val["children"] if "children" in val else cls.find_children(val)
         return {
             "doc_str": val.get("doc_string"),
-            "children": cls.find_children(val),
             **val,
+            "children": children,
             "src": src,
         }
 
@@ -99,21 +106,21 @@ class ASTNode(BaseModel):
 
     @classmethod
     def find_children(cls, node) -> list["ASTNode"]:
+        # NOTE: Validating a child runs `validate_node()` on it, which finds its
+        #   own children, so each node in the tree is only validated once.
+        # NOTE: Compiler output is decoded JSON, so exact type checks are enough here
+        #   and cheaper than `isinstance()` for the many scalar values in each node.
         children = []
-
-        def add_child(data):
-            data["children"] = cls.find_children(data)
-            child = cls.model_validate(data)
-            children.append(child)
-
         for value in node.values():
-            if isinstance(value, dict) and ("ast_type" in value or "nodeType" in value):
-                add_child(value)
+            value_type = type(value)
+            if value_type is dict:
+                if "ast_type" in value or "nodeType" in value:
+                    children.append(cls.model_validate(value))
 
-            elif isinstance(value, list):
+            elif value_type is list:
                 for _val in value:
-                    if isinstance(_val, dict) and ("ast_type" in _val or "nodeType" in _val):
-                        add_child(_val)
+                    if type(_val) is dict and ("ast_type" in _val or "nodeType" in _val):
+                        children.append(cls.model_validate(_val))
 
         return children
 
@@ -134,7 +141,30 @@ class ASTNode(BaseModel):
         **NOTE**: This is only populated on a ``Module`` AST node.
         """
 
-        return [n for n in self.children if n.ast_type == "FunctionDef"]
+        # NOTE: Return a new list so callers cannot modify the cached nodes.
+        return list(self._function_nodes)
+
+    @cached_property
+    def _function_nodes(self) -> tuple["ASTNode", ...]:
+        return tuple(n for n in self.children if n.ast_type == "FunctionDef")
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "children":
+            self._clear_children_caches()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Self":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "children" in update:
+            copied._clear_children_caches()
+
+        return copied
+
+    def _clear_children_caches(self):
+        self.__dict__.pop("_function_nodes", None)
+        self.__dict__.pop("_src_index", None)
 
     def __repr__(self) -> str:
         return str(self)
@@ -149,9 +179,11 @@ class ASTNode(BaseModel):
         Yield through all nodes in the tree, including this one.
         """
 
-        yield self
-        for node in self.children:
-            yield from node.iter_nodes()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
     def get_node(self, src: SourceMapItem) -> Optional["ASTNode"]:
         """
@@ -165,14 +197,17 @@ class ASTNode(BaseModel):
             Optional[``ASTNode``]: The matching node, if found, else ``None``.
         """
 
-        if self.src.start == src.start and (self.src.length or 0) == (src.length or 0):
-            return self
+        return self._src_index.get((src.start, src.length or 0))
 
-        for child in self.children:
-            if node := child.get_node(src):
-                return node
+    @cached_property
+    def _src_index(self) -> dict[tuple[Optional[int], int], "ASTNode"]:
+        # NOTE: Built on the first lookup; the first node in pre-order wins,
+        #   same as a depth-first search would return.
+        index: dict[tuple[Optional[int], int], "ASTNode"] = {}
+        for node in self.iter_nodes():
+            index.setdefault((node.src.start, node.src.length or 0), node)
 
-        return None
+        return index
 
     def get_nodes_at_line(self, line_numbers: "SourceLocation") -> list["ASTNode"]:
         """
@@ -193,12 +228,15 @@ class ASTNode(BaseModel):
                 "`(lineno, col_offset, end_lineno, end_coloffset)`"
             )
 
-        if all(x == y for x, y in zip(self.line_numbers, line_numbers)):
-            nodes.append(self)
+        # NOTE: Lists are accepted too, so normalize for a single tuple comparison.
+        location = tuple(line_numbers)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.line_numbers == location:
+                nodes.append(node)
 
-        for child in self.children:
-            subs = child.get_nodes_at_line(line_numbers)
-            nodes.extend(subs)
+            stack.extend(reversed(node.children))
 
         return nodes
 
@@ -215,7 +253,7 @@ class ASTNode(BaseModel):
               else ``None``.
         """
 
-        for function in self.functions:
+        for function in self._function_nodes:
             if function.get_nodes_at_line(line_numbers):
                 return function
 
@@ -1,18 +1,52 @@
 import json
+import re
+from typing import TYPE_CHECKING, Optional, Union
 
+import orjson
 from pydantic import BaseModel as _BaseModel
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
-def _set_dict_defaults(**kwargs) -> dict:
-    # NOTE: We do this to accommodate the aliases needed for EIP-2678 compatibility
-    if "by_alias" not in kwargs:
-        kwargs["by_alias"] = True
 
+_DUMP_DEFAULTS = {
+    # NOTE: We do this to accommodate the aliases needed for EIP-2678 compatibility
+    "by_alias": True,
     # EIP-2678: skip empty fields (at least by default)
-    if "exclude_none" not in kwargs:
-        kwargs["exclude_none"] = True
+    "exclude_none": True,
+}
+
+
+# NOTE: orjson writes floats (`1e16` vs `1e+16`), NaN/Infinity (`null` vs `NaN`)
+#   and DEL (raw vs `\u007f`) differently than `json`. Numbers are only floats when
+#   they contain a `.` or an exponent, and NaN/Infinity become `null`, so finding
+#   any of those (or DEL) after a `:`, `,` or `[` means the output may differ.
+#   This can match inside strings too, which only costs a fallback to `json`.
+_ORJSON_MISMATCH_PATTERN = re.compile(rb"[:,\[](?:-?\d+(?:\.|[eE])|null)|\x7f")
+
+# NOTE: orjson parses integers wider than 64 bits as floats, losing precision.
+#   Any number with 19+ digits could be such an integer, so those documents are
+#   left to pydantic. Like above, this can match inside strings too.
+_WIDE_INT_PATTERN = re.compile(r"[:,\[]\s*-?\d{19}")
+_WIDE_INT_BYTES_PATTERN = re.compile(rb"[:,\[]\s*-?\d{19}")
 
-    return kwargs
+
+def _orjson_dumps(result_dict: dict, sort_keys: bool) -> Optional[bytes]:
+    # NOTE: orjson's output is always minified, so it is used for the canonical form.
+    option = orjson.OPT_SORT_KEYS if sort_keys else None
+    try:
+        result = orjson.dumps(result_dict, option=option)
+    except TypeError:
+        # Integers wider than 64 bits or non-str keys; let `json` handle it.
+        return None
+
+    # NOTE: `json` escapes non-ASCII characters, so non-ASCII output gets
+    #   serialized a second time by the caller to keep the bytes (and thus the
+    #   IPFS hash) the same as before.
+    if result.isascii() and not _ORJSON_MISMATCH_PATTERN.search(result):
+        return result
+
+    return None
 
 
 def _to_json_str(model, *args, **kwargs) -> str:
@@ -24,26 +58,73 @@ def _to_json_str(model, *args, **kwargs) -> str:
     # EIP-2678: sort keys (at least by default)
     sort_keys = kwargs.pop("sort_keys", True)
 
+    # NOTE: Only the `json` module supports indenting with arbitrary widths.
+    indent = kwargs.pop("indent", None)
+
     # TODO: Find a better way to handle sorting the keys and custom separators.
     #    or open an issue(s) with pydantic. `super().model_dump_json()` does not
     #    support `sort_keys` or `separators`.
     kwargs["by_alias"] = True
     kwargs["mode"] = "json"
     result_dict = model.model_dump(*args, **kwargs)
-    return json.dumps(result_dict, sort_keys=sort_keys, separators=separators)
+
+    if (
+        indent is None
+        and tuple(separators) == (",", ":")
+        and (result := _orjson_dumps(result_dict, sort_keys)) is not None
+    ):
+        return result.decode()
+
+    return json.dumps(result_dict, sort_keys=sort_keys, separators=separators, indent=indent)
 
 
 class BaseModel(_BaseModel):
     def model_dump(self, *args, **kwargs) -> dict:
-        kwargs = _set_dict_defaults(**kwargs)
-        return super().model_dump(*args, **kwargs)
+        return super().model_dump(*args, **{**_DUMP_DEFAULTS, **kwargs})
 
     def model_dump_json(self, *args, **kwargs) -> str:
         return _to_json_str(self, *args, **kwargs)
 
     def dict(self, *args, **kwargs) -> dict:
-        kwargs = _set_dict_defaults(**kwargs)
-        return super().dict(*args, **kwargs)
+        # NOTE: Skip pydantic's deprecated `dict()` shim (and its warning);
+        #   it only forwards to `model_dump()` anyway.
+        return self.model_dump(*args, **kwargs)
 
     def json(self, *args, **kwargs) -> str:
         return _to_json_str(self, *args, **kwargs)
+
+    def to_canonical_bytes(self) -> bytes:
+        """
+        The EIP-2678 canonical JSON (sorted keys, minified) as bytes,
+        such as for computing an IPFS hash. Same as ``model_dump_json().encode()``
+        without the intermediate ``str``.
+        """
+        result_dict = self.model_dump(mode="json", by_alias=True)
+        if (result := _orjson_dumps(result_dict, True)) is not None:
+            return result
+
+        return json.dumps(result_dict, sort_keys=True, separators=(",", ":")).encode()
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: Union[str, bytes, bytearray], *args, **kwargs
+    ) -> "Self":
+        # NOTE: Parsing with orjson first and then validating the native objects
+        #   is faster for large documents (such as manifests) than pydantic's JSON mode.
+        #   Options such as `strict` behave differently in Python mode, so only the
+        #   plain call is sped up.
+        if isinstance(json_data, str):
+            has_wide_int = _WIDE_INT_PATTERN.search(json_data) is not None
+        else:
+            has_wide_int = _WIDE_INT_BYTES_PATTERN.search(json_data) is not None
+
+        if args or kwargs or has_wide_int:
+            return super().model_validate_json(json_data, *args, **kwargs)
+
+        try:
+            data = orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            # Let pydantic raise its usual `ValidationError`.
+            return super().model_validate_json(json_data, *args, **kwargs)
+
+        return cls.model_validate(data, *args, **kwargs)
@@ -1,10 +1,11 @@
-from collections.abc import Callable, Iterable
-from functools import cached_property, singledispatchmethod
-from typing import Optional, TypeVar, Union, cast
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, Optional, SupportsIndex, TypeVar, Union, cast
 
 from eth_pydantic_types import Address, HashStr32, HexBytes, HexStr
-from eth_utils import is_0x_prefixed
-from pydantic import Field, computed_field, field_validator
+from eth_utils import is_0x_prefixed, keccak
+from pydantic import Discriminator, Field, Tag, computed_field, field_validator
 
 from ethpm_types.abi import (
     ABI,
@@ -20,6 +21,44 @@ from ethpm_types.ast import ASTNode
 from ethpm_types.base import BaseModel
 from ethpm_types.sourcemap import PCMap, SourceMap
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_KNOWN_ABI_TYPES = frozenset(
+    ("constructor", "fallback", "receive", "function", "event", "error", "struct")
+)
+
+
+def _get_abi_tag(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        # NOTE: Per the ABI spec, ``type`` defaults to ``"function"``.
+        abi_type = value.get("type", "function")
+    else:
+        abi_type = getattr(value, "type", None)
+
+    return abi_type if abi_type in _KNOWN_ABI_TYPES else None
+
+
+_KnownABI = Annotated[
+    Union[
+        Annotated[ConstructorABI, Tag("constructor")],
+        Annotated[FallbackABI, Tag("fallback")],
+        Annotated[ReceiveABI, Tag("receive")],
+        Annotated[MethodABI, Tag("function")],
+        Annotated[EventABI, Tag("event")],
+        Annotated[ErrorABI, Tag("error")],
+        Annotated[StructABI, Tag("struct")],
+    ],
+    Discriminator(_get_abi_tag),
+]
+_ValidatedABI = Annotated[Union[_KnownABI, ABI], Field(union_mode="left_to_right")]
+"""
+Validates the same as ``ABI``, but picks the model by its ``type`` instead of trying
+every member of the union, which is much faster for large ABIs. Entries without a
+``type`` are functions. Entries with an unknown ``type`` (or that are invalid for
+their ``type``) still go through the full ``ABI`` union.
+"""
+
 ABI_W_SELECTOR_T = Union[ConstructorABI, MethodABI, EventABI, StructABI, ErrorABI]
 """ABI types with selectors"""
 
@@ -99,19 +138,48 @@ class Bytecode(BaseModel):
     """
 
     def __repr__(self) -> str:
-        self_str = super().__repr__()
+        args = []
+        for name, value in self.__repr_args__():
+            if name == "bytecode" and value and len(value) > 10:
+                # Truncate bytecode for display
+                value = f"{value[:5]}...{value[-3:]}"
 
-        # Truncate bytecode for display
-        if self.bytecode and len(self.bytecode) > 10:
-            self_str = self_str.replace(
-                self.bytecode, self.bytecode[:5] + "..." + self.bytecode[-3:]
-            )
+            args.append(repr(value) if name is None else f"{name}={value!r}")
+
+        return f"{self.__class__.__name__}({', '.join(args)})"
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "bytecode":
+            self.__dict__.pop("_bytes", None)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Self":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "bytecode" in update:
+            copied.__dict__.pop("_bytes", None)
 
-        return self_str
+        return copied
 
     def to_bytes(self) -> Optional[HexBytes]:
         # TODO: Resolve links to produce dynamically linked bytecode
-        return HexBytes(self.bytecode) if self.bytecode else None
+        return self._bytes
+
+    @cached_property
+    def _bytes(self) -> Optional[HexBytes]:
+        # NOTE: Bytecode can be many kilobytes, so only decode the hex once.
+        if not (code := self.bytecode):
+            return None
+
+        # NOTE: Decode with `bytes.fromhex()` directly rather than through the
+        #   `HexBytes` constructor's type dispatch. Assigned values are not
+        #   validated, so still handle a missing prefix or odd length.
+        hex_value = code[2:] if code.startswith("0x") else code
+        if len(hex_value) % 2:
+            hex_value = f"0{hex_value}"
+
+        return HexBytes(bytes.fromhex(hex_value))
 
 
 class ContractInstance(BaseModel):
@@ -159,89 +227,136 @@ class ABIList(list[ABILIST_T]):
         self._selector_hash_fn = selector_hash_fn
         super().__init__(iterable or ())
 
-    @singledispatchmethod
     def __getitem__(self, selector):
-        raise NotImplementedError(f"Cannot use {type(selector)} as a selector.")
+        if isinstance(selector, (int, slice)):
+            return super().__getitem__(selector)
+
+        elif (abi := self._find(selector)) is not None:
+            return abi
+
+        raise KeyError(selector)
+
+    def _find(self, selector) -> Optional[ABILIST_T]:
+        # NOTE: Dispatch by hand rather than with `singledispatchmethod`; this is
+        #   called in hot loops (e.g. decoding calldata) and the checks are
+        #   ordered by how often each selector type is used. Misses return `None`
+        #   rather than raising so `in` checks do not pay for exceptions.
+        if isinstance(selector, str):
+            return self._find_str(selector)
+        elif isinstance(selector, bytes):
+            return self._find_bytes(selector)
+        elif isinstance(selector, (MethodABI, EventABI)):
+            return self._find_str(selector.selector)
 
-    @__getitem__.register
-    def __getitem_int(self, selector: int) -> ABILIST_T:
-        return super().__getitem__(selector)
-
-    @__getitem__.register
-    def __getitem_slice(self, selector: slice) -> list[ABILIST_T]:
-        return super().__getitem__(selector)
-
-    @__getitem__.register
-    def __getitem_str(self, selector: str) -> ABILIST_T:
-        try:
-            if "(" in selector:
-                # String-style selector e.g. `method(arg0)`.
-                return next(abi for abi in self if abi.selector == selector)
-
-            elif is_0x_prefixed(selector):
-                # Hashed bytes selector, but as a hex str.
-                return self.__getitem__(HexBytes(selector))
-
-            # Search by name (could be ambiguous()
-            return next(abi for abi in self if abi.name == selector)
-
-        except StopIteration:
-            raise KeyError(selector)
-
-    @__getitem__.register
-    def __getitem_bytes(self, selector: bytes) -> ABILIST_T:
-        try:
-            if self._selector_hash_fn:
-                return next(
-                    abi
-                    for abi in self
-                    if self._selector_hash_fn(abi.selector)[: self._selector_id_size]
-                    == selector[: self._selector_id_size]
-                )
-
-            else:
-                raise KeyError(selector)
-
-        except StopIteration:
-            raise KeyError(selector)
-
-    @__getitem__.register
-    def __getitem_method_abi(self, selector: MethodABI) -> ABILIST_T:
-        return self.__getitem__(selector.selector)
-
-    @__getitem__.register
-    def __getitem_event_abi(self, selector: EventABI) -> ABILIST_T:
-        return self.__getitem__(selector.selector)
-
-    @singledispatchmethod
-    def __contains__(self, selector) -> bool:  # type: ignore[override]
         raise NotImplementedError(f"Cannot use {type(selector)} as a selector.")
 
-    @__contains__.register
-    def __contains_str(self, selector: str) -> bool:
-        return self._contains(selector)
+    def _find_str(self, selector: str) -> Optional[ABILIST_T]:
+        if "(" in selector:
+            # String-style selector e.g. `method(arg0)`.
+            return self._by_selector.get(selector)
 
-    @__contains__.register
-    def __contains_bytes(self, selector: bytes) -> bool:
-        return self._contains(selector)
+        elif is_0x_prefixed(selector):
+            # Hashed bytes selector, but as a hex str.
+            return self._find_bytes(HexBytes(selector))
 
-    @__contains__.register
-    def __contains_method_abi(self, selector: MethodABI) -> bool:
-        return self._contains(selector)
+        # Search by name (could be ambiguous()
+        return self._by_name.get(selector)
 
-    @__contains__.register
-    def __contains_event_abi(self, selector: EventABI) -> bool:
-        return self._contains(selector)
+    def _find_bytes(self, selector: bytes) -> Optional[ABILIST_T]:
+        return self._by_hashed_selector.get(bytes(selector[: self._selector_id_size]))
 
-    def get(self, item, default: Optional[ABILIST_T] = None) -> Optional[ABILIST_T]:
-        return self[item] if item in self else default
+    @cached_property
+    def _by_selector(self) -> dict[str, ABILIST_T]:
+        lookup: dict[str, ABILIST_T] = {}
+        for abi in self:
+            # NOTE: `setdefault` so the first match wins, like a linear search.
+            #   Keys are interned so lookups with literal (interned) strings
+            #   can match by identity.
+            lookup.setdefault(sys.intern(abi.selector), abi)
 
-    def _contains(self, selector: Union[str, bytes, MethodABI, EventABI]) -> bool:
-        try:
-            _ = self[selector]
-            return True
-        except (KeyError, IndexError):
-            return False
+        return lookup
+
+    @cached_property
+    def _by_name(self) -> dict[str, ABILIST_T]:
+        lookup: dict[str, ABILIST_T] = {}
+        for abi in self:
+            lookup.setdefault(sys.intern(abi.name), abi)
+
+        return lookup
+
+    @cached_property
+    def _by_hashed_selector(self) -> dict[bytes, ABILIST_T]:
+        lookup: dict[bytes, ABILIST_T] = {}
+        if not self._selector_hash_fn:
+            return lookup
+
+        for abi in self:
+            key = self._selector_hash_fn(abi.selector)[: self._selector_id_size]
+            lookup.setdefault(bytes(key), abi)
+
+        return lookup
+
+    def _clear_lookups(self):
+        for name in ("_by_selector", "_by_name", "_by_hashed_selector"):
+            self.__dict__.pop(name, None)
+
+    # NOTE: The lookup tables are built on first use, so any change
+    #   to the list's items (or their order) must clear them.
+
+    def __setitem__(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().__setitem__(*args, **kwargs)
+
+    def __delitem__(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().__delitem__(*args, **kwargs)
+
+    def __iadd__(self, other: Iterable[ABILIST_T]) -> "Self":  # type: ignore[misc,override]
+        self._clear_lookups()
+        return super().__iadd__(other)
+
+    def __imul__(self, other: SupportsIndex) -> "Self":  # type: ignore[misc]
+        self._clear_lookups()
+        return super().__imul__(other)
+
+    def append(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().append(*args, **kwargs)
+
+    def extend(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().extend(*args, **kwargs)
+
+    def insert(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().insert(*args, **kwargs)
+
+    def pop(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().pop(*args, **kwargs)
+
+    def remove(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().remove(*args, **kwargs)
+
+    def clear(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().clear(*args, **kwargs)
+
+    def reverse(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().reverse(*args, **kwargs)
+
+    def sort(self, *args, **kwargs):
+        self._clear_lookups()
+        return super().sort(*args, **kwargs)
+
+    def __contains__(self, selector) -> bool:
+        return self._find(selector) is not None
+
+    def get(self, item, default: Optional[ABILIST_T] = None) -> Optional[ABILIST_T]:
+        abi = self._find(item)
+        return default if abi is None else abi
 
 
 class ContractType(BaseModel):
@@ -268,7 +383,7 @@ class ContractType(BaseModel):
     runtime_bytecode: Optional[Bytecode] = Field(default=None, alias="runtimeBytecode")
     """The unlinked 0x-prefixed runtime portion of bytecode for this ContractType."""
 
-    abi: list[ABI] = []
+    abi: list[_ValidatedABI] = []
     """The application binary interface to the contract."""
 
     sourcemap: Optional[SourceMap] = None
@@ -320,16 +435,47 @@ class ContractType(BaseModel):
         return f"<{repr_id}>"
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, ContractType):
+        if self is other:
+            return True
+
+        elif not isinstance(other, ContractType):
             return NotImplemented
 
+        # NOTE: Compare the cheap fields first; the ABI lists can be large.
         return (
             other.name == self.name
-            and other.abi == self.abi
             and self.runtime_bytecode == other.runtime_bytecode
             and self.deployment_bytecode == other.deployment_bytecode
+            and len(other.abi) == len(self.abi)
+            and other.abi == self.abi
         )
 
+    def __hash__(self) -> int:
+        # NOTE: Only uses fields that `__eq__` also compares, so equal contract types
+        #   hash the same. Not cached, as contract types are mutable.
+        return hash(
+            (
+                self.name,
+                self.runtime_bytecode.bytecode if self.runtime_bytecode else None,
+                self.deployment_bytecode.bytecode if self.deployment_bytecode else None,
+                len(self.abi),
+            )
+        )
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "abi":
+            self._clear_abi_caches()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Self":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "abi" in update:
+            copied._clear_abi_caches()
+
+        return copied
+
     def get_runtime_bytecode(self) -> Optional[HexBytes]:
         if bytecode := self.runtime_bytecode:
             return bytecode.to_bytes()
@@ -383,6 +529,11 @@ class ContractType(BaseModel):
             rest_attributes = {}
             code = value
 
+        if isinstance(code, str) and code.startswith("0x"):
+            # NOTE: The `HexStr` field already validates (and normalizes) these,
+            #   so skip the round-trip through bytes.
+            return {**rest_attributes, "bytecode": code}
+
         code_bytes = code if isinstance(code, bytes) else HexBytes(code)
         return {**rest_attributes, "bytecode": code_bytes.hex()}
 
@@ -425,9 +576,7 @@ class ContractType(BaseModel):
         Returns:
             List[:class:`~ethpm_types.abi.ABI`]
         """
-        return self._get_abis(
-            selector_id_size=4, filter_fn=lambda x: isinstance(x, MethodABI) and not x.is_stateful
-        )
+        return self._get_abis("view_methods", selector_id_size=4)
 
     @property
     def mutable_methods(self) -> ABIList[MethodABI]:
@@ -437,9 +586,7 @@ class ContractType(BaseModel):
         Returns:
             List[:class:`~ethpm_types.abi.ABI`]
         """
-        return self._get_abis(
-            selector_id_size=4, filter_fn=lambda x: isinstance(x, MethodABI) and x.is_stateful
-        )
+        return self._get_abis("mutable_methods", selector_id_size=4)
 
     @property
     def events(self) -> ABIList[EventABI]:
@@ -449,7 +596,7 @@ class ContractType(BaseModel):
         Returns:
             :class:`~ethpm_types.contract_type.ABIList`
         """
-        return self._get_abis(filter_fn=lambda a: isinstance(a, EventABI))
+        return self._get_abis("events")
 
     @property
     def errors(self) -> ABIList[ErrorABI]:
@@ -459,7 +606,7 @@ class ContractType(BaseModel):
         Returns:
             :class:`~ethpm_types.contract_type.ABIList`
         """
-        return self._get_abis(selector_id_size=4, filter_fn=lambda a: isinstance(a, ErrorABI))
+        return self._get_abis("errors", selector_id_size=4)
 
     @property
     def methods(self) -> ABIList:
@@ -469,7 +616,7 @@ class ContractType(BaseModel):
         Returns:
             :class:`~ethpm_types.contract_type.ABIList`
         """
-        return self._get_abis(selector_id_size=4, filter_fn=lambda a: isinstance(a, MethodABI))
+        return self._get_abis("methods", selector_id_size=4)
 
     @property
     def structs(self) -> ABIList:
@@ -479,7 +626,7 @@ class ContractType(BaseModel):
         Returns:
             class:`~ethpm_types.contract_type.ABIList`
         """
-        return self._get_abis(filter_fn=lambda a: isinstance(a, StructABI))
+        return self._get_abis("structs")
 
     @property
     def natspecs(self) -> dict[str, str]:
@@ -516,45 +663,53 @@ class ContractType(BaseModel):
     @classmethod
     def _selector_hash_fn(cls, selector: str) -> bytes:
         # keccak is the default on most ecosystems, other ecosystems can subclass to override it
-        from eth_utils import keccak
-
-        return keccak(text=selector)
-
-    def _get_abis(
-        self,
-        selector_id_size: int = 32,
-        filter_fn: Optional[Callable[[ABI], bool]] = None,
-    ):
-        def noop(a: ABI) -> bool:
-            return True
-
-        filter_fn = filter_fn or noop
-        method_abis = [abi for abi in self.abi if filter_fn(abi)]
+        return _keccak_text(selector)
 
+    def _get_abis(self, key: str, selector_id_size: int = 32):
         return ABIList(
-            method_abis,
+            self._abi_index[key],
             selector_id_size=selector_id_size,
             selector_hash_fn=self._selector_hash_fn,
         )
 
     def _get_first_instance(self, _type: type[ABI_SINGLETON_T]) -> Optional[ABI_SINGLETON_T]:
+        abis = self._abi_index[_type.model_fields["type"].default]
+        return cast(ABI_SINGLETON_T, abis[0]) if abis else None
+
+    @cached_property
+    def _abi_index(self) -> dict[str, list[ABI]]:
+        # NOTE: Bucket the ABIs in a single pass. The properties build fresh
+        #   `ABIList` objects from these so callers cannot corrupt the cache.
+        index: dict[str, list[ABI]] = {key: [] for key in _ABI_INDEX_KEYS}
         for abi in self.abi:
-            if not isinstance(abi, _type):
-                continue
+            # NOTE: Dispatch on the exact type; only subclasses (rare) need `isinstance()`.
+            if (key := _ABI_INDEX_KEY_BY_TYPE.get(type(abi))) is None:
+                matches = (k for t, k in _ABI_INDEX_KEY_BY_TYPE.items() if isinstance(abi, t))
+                if (key := next(matches, None)) is None:
+                    continue
 
-            return abi
+            index[key].append(abi)
+            if key == "methods":
+                is_stateful = cast(MethodABI, abi).is_stateful
+                index["mutable_methods" if is_stateful else "view_methods"].append(abi)
 
-        return None
+        return index
+
+    def _clear_abi_caches(self):
+        for name in _ABI_CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     @cached_property
     def _abi_identifiers(self) -> list[tuple[ABI_W_SELECTOR_T, str]]:
         def get_id(aitem: ABI_W_SELECTOR_T) -> str:
-            bytes_val = (
-                self._selector_hash_fn(aitem.selector)[:4]
-                if isinstance(aitem, (MethodABI, ErrorABI))
-                else self._selector_hash_fn(aitem.selector)
-            )
-            return HexStr.__eth_pydantic_validate__(bytes_val)
+            bytes_val = self._selector_hash_fn(aitem.selector)
+            if isinstance(aitem, (MethodABI, ErrorABI)):
+                bytes_val = bytes_val[:4]
+
+            # NOTE: Same as `HexStr.__eth_pydantic_validate__(bytes_val)`, without the
+            #   type dispatch. `bytes.hex()` is used in case a subclass's hash function
+            #   returns `HexBytes`, whose `.hex()` may already include the `0x` prefix.
+            return HexStr(f"0x{bytes.hex(bytes_val)}")
 
         abis_with_selector = cast(
             list[ABI_W_SELECTOR_T], [x for x in self.abi if hasattr(x, "selector")]
@@ -562,6 +717,44 @@ class ContractType(BaseModel):
         return [(x, get_id(x)) for x in abis_with_selector]
 
 
+_ABI_INDEX_KEYS = (
+    "constructor",
+    "fallback",
+    "receive",
+    "view_methods",
+    "mutable_methods",
+    "events",
+    "errors",
+    "methods",
+    "structs",
+)
+_ABI_INDEX_KEY_BY_TYPE: dict[type, str] = {
+    MethodABI: "methods",
+    EventABI: "events",
+    ErrorABI: "errors",
+    StructABI: "structs",
+    ConstructorABI: "constructor",
+    FallbackABI: "fallback",
+    ReceiveABI: "receive",
+}
+_ABI_CACHED_PROPERTIES = (
+    "_abi_index",
+    "_abi_identifiers",
+    "method_identifiers",
+    "_method_natspecs",
+    "_event_natspecs",
+    "_error_natspecs",
+    "_struct_natspecs",
+)
+
+
+@lru_cache(maxsize=4096)
+def _keccak_text(text: str) -> bytes:
+    # NOTE: The same selectors get hashed over and over (every ABIList lookup,
+    #   every contract sharing an interface), so remember the digests.
+    return keccak(text=text)
+
+
 def _extract_natspec(devdoc: dict, devdoc_key: str, abis: ABIList) -> dict[str, str]:
     result: dict[str, str] = {}
     devdocs = devdoc.get(devdoc_key, {})
@@ -1,5 +1,8 @@
+import re
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from eth_pydantic_types import Bip122Uri
 from pydantic import Field, field_validator, model_validator
@@ -11,8 +14,12 @@ from ethpm_types.contract_type import ContractInstance, ContractType
 from ethpm_types.source import Compiler, Source
 from ethpm_types.utils import AnyUrl
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 ALPHABET = set("abcdefghijklmnopqrstuvwxyz")
 NUMBERS = set("0123456789")
+_PACKAGE_NAME_PATTERN = re.compile(r"[a-z][-a-z0-9]{0,254}")
 
 
 def PackageNameError(name: str, message: str) -> PydanticCustomError:
@@ -26,16 +33,17 @@ def validate_package_name(name: str, info) -> str:
         # Those no longer turn to ValidationError in Pydantic.
         raise PackageNameError(name, "`name` element must be a `str`")
 
+    elif _PACKAGE_NAME_PATTERN.fullmatch(name):
+        return name
+
+    # NOTE: The name is invalid; find out why for a helpful error message.
     elif not (0 < len(name) < 256):
         raise PackageNameError(name, "Length must be between 1 and 255")
 
     elif name[0] not in ALPHABET:
         raise PackageNameError(name, "First character in name must be a-z")
 
-    elif set(name) > ALPHABET.union(NUMBERS).union("-"):
-        raise PackageNameError(name, "Characters in name must be one of a-z or 0-9 or '-'")
-
-    return name
+    raise PackageNameError(name, "Characters in name must be one of a-z or 0-9 or '-'")
 
 
 class PackageName(str):
@@ -185,7 +193,10 @@ class PackageManifest(BaseModel):
 
         sources_fixed = {}
         for src_id, source_obj in sources.items():
-            if isinstance(source_obj, str):
+            if isinstance(source_obj, Source):
+                # Already validated (e.g. built programmatically or round-tripping).
+                sources_fixed[src_id] = source_obj
+            elif isinstance(source_obj, str):
                 # Backwards compat: Allow str-based sources.
                 sources_fixed[src_id] = Source.model_validate({"content": source_obj})
             elif isinstance(source_obj, dict):
@@ -194,8 +205,12 @@ class PackageManifest(BaseModel):
                 sources_fixed[src_id] = source_obj
 
         contract_types = values.get("contract_types", {}) or {}
-        for alias in contract_types:
-            source_id = values["contract_types"][alias].source_id
+        for contract_type in contract_types.values():
+            if isinstance(contract_type, dict):
+                source_id = contract_type.get("sourceId", contract_type.get("source_id"))
+            else:
+                source_id = contract_type.source_id
+
             if source_id and (source_id not in sources_fixed):
                 raise PydanticCustomError(
                     f"{PackageManifest.__name__}Error",
@@ -219,14 +234,28 @@ class PackageManifest(BaseModel):
 
         return values
 
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "compilers":
+            self._clear_compiler_caches()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Self":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "compilers" in update:
+            copied._clear_compiler_caches()
+
+        return copied
+
     def __getattr__(self, attr_name: str):
-        try:
-            # Check if regular attribute.
-            return self.__getattribute__(attr_name)
-        except AttributeError:
-            # Check if contract type name.
-            if contract_type := self.get_contract_type(attr_name):
-                return contract_type
+        # NOTE: Python only calls this after regular attribute lookup failed,
+        #   so only check for a contract type name. Read the field from `__dict__`
+        #   to avoid recursing here when it is not set yet (e.g. while copying).
+        if (contract_types := self.__dict__.get("contract_types")) and (
+            contract_type := contract_types.get(attr_name)
+        ):
+            return contract_type
 
         # NOTE: **must** raise `AttributeError` or return here, or else Python breaks
         raise AttributeError(
@@ -242,11 +271,7 @@ class PackageManifest(BaseModel):
         Returns:
           Optional[:class:`~ethpm_types.contract_type.ContractType`]
         """
-        return (
-            self.contract_types[name]
-            if self.contract_types and name in self.contract_types
-            else None
-        )
+        return self.contract_types.get(name) if self.contract_types else None
 
     def unpack_sources(self, destination: Path):
         """
@@ -285,11 +310,7 @@ class PackageManifest(BaseModel):
         Returns:
             Optional[`~ethpm_types.source.Compiler`]
         """
-        for compiler in self.compilers or []:
-            if compiler.name == name.lower() and compiler.version == version:
-                return compiler
-
-        return None
+        return self._compilers_by_version.get((name.lower(), version))
 
     def get_contract_compiler(self, contract_type_name: str) -> Optional[Compiler]:
         """
@@ -301,11 +322,29 @@ class PackageManifest(BaseModel):
         Returns:
             Optional[`~ethpm_types.source.Compiler`]
         """
+        return self._compilers_by_contract_type.get(contract_type_name)
+
+    @cached_property
+    def _compilers_by_version(self) -> dict[tuple[str, str], Compiler]:
+        lookup: dict[tuple[str, str], Compiler] = {}
+        for compiler in self.compilers or []:
+            # NOTE: `setdefault` so the first match wins, like a linear search.
+            lookup.setdefault((compiler.name, compiler.version), compiler)
+
+        return lookup
+
+    @cached_property
+    def _compilers_by_contract_type(self) -> dict[str, Compiler]:
+        lookup: dict[str, Compiler] = {}
         for compiler in self.compilers or []:
-            if contract_type_name in (compiler.contractTypes or []):
-                return compiler
+            for contract_type_name in compiler.contractTypes or []:
+                lookup.setdefault(contract_type_name, compiler)
+
+        return lookup
 
-        return None
+    def _clear_compiler_caches(self):
+        for name in ("_compilers_by_version", "_compilers_by_contract_type"):
+            self.__dict__.pop(name, None)
 
     def add_compilers(self, *compilers: Compiler):
         """
@@ -319,5 +358,13 @@ class PackageManifest(BaseModel):
         """
 
         start = self.compilers or []
-        start.extend([c for c in compilers if c not in start])
+
+        # NOTE: `Compiler` hashes by name, version, and settings (the same as
+        #   its equality), so use a set rather than comparing against each one.
+        seen = set(start)
+        for compiler in compilers:
+            if compiler not in seen:
+                seen.add(compiler)
+                start.append(compiler)
+
         self.compilers = start
@@ -16,6 +16,7 @@ from ethpm_types.utils import (
     Algorithm,
     AnyUrl,
     compute_checksum,
+    compute_file_checksum,
     stringify_dict_for_hash,
 )
 
@@ -78,6 +79,8 @@ class Checksum(BaseModel):
     """
     The algorithm used to generate the corresponding hash.
     Possible algorithms include, but are not limited to sha3, sha256, md5, keccak256.
+    **NOTE**: ``blake2b`` is not part of EIP-2678; older ethpm-types versions and other
+    tools will fail to read checksums that use it.
     """
 
     hash: HexStr
@@ -88,7 +91,8 @@ class Checksum(BaseModel):
     @classmethod
     def from_file(cls, file: Union[Path, str], algorithm: Algorithm = Algorithm.MD5) -> "Checksum":
         source_path = file if isinstance(file, Path) else Path(file)
-        return cls.from_bytes(source_path.read_bytes(), algorithm=algorithm)
+        checksum = compute_file_checksum(source_path, algorithm=algorithm)
+        return cls(algorithm=algorithm, hash=checksum)
 
     @classmethod
     def from_bytes(cls, data: bytes, algorithm: Algorithm = Algorithm.MD5) -> "Checksum":
@@ -144,11 +148,9 @@ class Content(RootModel[dict[int, str]]):
 
     @model_serializer()
     def _serialize_content(self, info):
-        content_str = "\n".join(self.root.values())
-        if not content_str.endswith("\n"):
-            content_str = f"{content_str}\n"
-
-        return content_str
+        # NOTE: Same as `str()`, so sources dump the same at the top-level
+        #   and when nested in a manifest.
+        return str(self)
 
     def encode(self, *args, **kwargs) -> bytes:
         return str(self).encode(*args, **kwargs)
@@ -293,15 +295,6 @@ class Source(BaseModel):
 
         return len(self.content)
 
-    def model_dump(self, *args, **kwargs) -> dict:
-        res = super().model_dump(*args, **kwargs)
-        if self.content is not None:
-            res["content"] = str(self.content)
-        elif "content" in res:
-            del res["content"]
-
-        return res
-
     def fetch_content(self) -> str:
         """
         Fetch the content for the given Source object.
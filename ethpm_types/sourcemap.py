@@ -1,4 +1,5 @@
 from collections.abc import Iterator
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional, Union
 
 from pydantic import RootModel, model_validator
@@ -54,7 +55,9 @@ class SourceMapItem(BaseModel):
             contract_id = int(cls._extract_value(row, 2, previous=previous.contract_id or -1))
             jump_code = cls._extract_value(row, 3, previous=previous.jump_code or "")
 
-        return SourceMapItem.model_construct(
+        # NOTE: For a model this small, pydantic-core's validating constructor is
+        #   faster than the pure-Python `model_construct()`.
+        return SourceMapItem(
             # NOTE: `-1` for these three entries means `None`
             start=start if start != -1 else None,
             length=length if length != -1 else None,
@@ -90,6 +93,11 @@ class SourceMap(RootModel[str]):
     def __str__(self) -> str:
         return self.root
 
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "root":
+            self.__dict__.pop("_checkpoints", None)
+
     def parse(self) -> Iterator[SourceMapItem]:
         """
         Parses the source map string into a stream of
@@ -101,15 +109,118 @@ class SourceMap(RootModel[str]):
             Iterator[:class:`~ethpm_types.contract_type.SourceMapItem`]
         """
 
-        item = None
+        for _, start, length, contract_id, jump_code in self._iter_rows():
+            yield _make_item(start, length, contract_id, jump_code)
+
+    def at(self, index: int) -> SourceMapItem:
+        """
+        Get a single item of the source map, the same as ``list(self.parse())[index]``
+        but without parsing the whole map. Useful for looking up a few instructions
+        in a large source map.
+
+        Args:
+            index (int): The index of the item (instruction) in the source map.
+
+        Returns:
+            :class:`~ethpm_types.contract_type.SourceMapItem`
+        """
+
+        checkpoints, num_rows = self._checkpoints
+        if index < 0:
+            index += num_rows
+
+        if not 0 <= index < num_rows:
+            raise IndexError("Source map index out of range.")
+
+        rows = self._iter_rows(*checkpoints[index // _CHECKPOINT_INTERVAL])
+        for _ in range(index % _CHECKPOINT_INTERVAL):
+            next(rows)
+
+        _, start, length, contract_id, jump_code = next(rows)
+        return _make_item(start, length, contract_id, jump_code)
+
+    @cached_property
+    def _checkpoints(self) -> tuple[list[tuple], int]:
+        # NOTE: Each row depends on the rows before it, so remember the parser's
+        #   state every so often; `at()` then only re-parses from the closest one.
+        checkpoints: list[tuple] = [(0, -1, -1, -1, "", True)]
+        num_rows = 0
+        for row_start, start, length, contract_id, jump_code in self._iter_rows():
+            num_rows += 1
+            if num_rows % _CHECKPOINT_INTERVAL == 0 and row_start != -1:
+                # NOTE: Copied `0` values become `None`, see `_iter_rows()`.
+                state = (start or -1, length or -1, contract_id or -1, jump_code, False)
+                checkpoints.append((row_start, *state))
+
+        return checkpoints, num_rows
+
+    def _iter_rows(
+        self,
+        row_start: int = 0,
+        start: int = -1,
+        length: int = -1,
+        contract_id: int = -1,
+        jump_code: str = "",
+        is_first: bool = True,
+    ) -> Iterator[tuple[int, int, int, int, str]]:
+        # NOTE: Yields the start of the next row (`-1` when done) and the values of
+        #   each row. Same results as chaining `SourceMapItem.parse_str(row, previous=item)`,
+        #   but the previous values are kept in locals (`-1` meaning `None`) rather
+        #   than read back from the last model on each row.
 
         # NOTE: Format of SourceMap is like `1:2:3:a;;4:5:6:b;;;`
         #       where an empty entry means to copy the previous step.
         #       This is because sourcemaps are compressed to save space.
-        for i, row in enumerate(self.root.strip().split(";")):
-            # NOTE: Set ``item`` so it updates each time for `previous` kwarg.
-            item = SourceMapItem.parse_str(row, previous=item)
-            yield item
+        #       Rows are sliced off one at a time rather than splitting the whole
+        #       (possibly multi-megabyte) map into a list up front.
+        sourcemap = self.root.strip()
+        while row_start >= 0:
+            row_end = sourcemap.find(";", row_start)
+            if row_end == -1:
+                row = sourcemap[row_start:]
+                row_start = -1
+            else:
+                row = sourcemap[row_start:row_end]
+                row_start = row_end + 1
+
+            if row:
+                parts = row.split(":", 4)
+                num_parts = len(parts)
+                if parts[0]:
+                    start = int(parts[0])
+                if num_parts > 1 and parts[1]:
+                    length = int(parts[1])
+                if num_parts > 2 and parts[2]:
+                    contract_id = int(parts[2])
+                if num_parts > 3 and parts[3]:
+                    jump_code = parts[3]
+
+            if is_first:
+                # NOTE: Like `parse_str()` without `previous`, `0` means `None` here.
+                start = start or -1
+                length = length or -1
+                contract_id = contract_id or -1
+                is_first = False
+
+            yield row_start, start, length, contract_id, jump_code
+
+            # NOTE: Like `parse_str()` with `previous`, copied `0` values become `None`.
+            start = start or -1
+            length = length or -1
+            contract_id = contract_id or -1
+
+
+_CHECKPOINT_INTERVAL = 256
+
+
+def _make_item(start: int, length: int, contract_id: int, jump_code: str) -> SourceMapItem:
+    # NOTE: Not `model_construct()`; see `SourceMapItem.parse_str()`.
+    return SourceMapItem(
+        start=start if start != -1 else None,
+        length=length if length != -1 else None,
+        contract_id=contract_id if contract_id != -1 else None,
+        jump_code=jump_code,
+    )
 
 
 class PCMapItem(BaseModel):
@@ -1,7 +1,9 @@
 import json
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from hashlib import md5, sha3_256, sha256
+from hashlib import blake2b, md5, sha3_256, sha256
+from pathlib import Path
 from typing import Annotated, Any, Optional, Union
 
 from eth_pydantic_types import HexStr
@@ -11,15 +13,45 @@ from pydantic import FileUrl
 CONTENT_ADDRESSED_SCHEMES = {"ipfs"}
 AnyUrl = Union[FileUrl, _AnyUrl]
 
+# NOTE: Same buffer size `hashlib.file_digest()` uses.
+_CHECKSUM_CHUNK_SIZE = 2**18
+
+# NOTE: Below this many bytes in total, hashing inline beats starting threads.
+_PARALLEL_CHECKSUM_MIN_SIZE = 2**20
+
 
 class Algorithm(str, Enum):
     """
-    Algorithm enum options MD5, SHA3, and SHA256.
+    Algorithm enum options MD5, SHA3, SHA256, and BLAKE2B.
     """
 
     MD5 = "md5"
     SHA3 = "sha3"
     SHA256 = "sha256"
+    BLAKE2B = "blake2b"
+
+
+def _new_hash(algorithm: Algorithm):
+    if isinstance(algorithm, str):
+        algorithm = Algorithm(algorithm)
+
+    if algorithm is Algorithm.MD5:
+        return md5()
+
+    elif algorithm is Algorithm.SHA3:
+        return sha3_256()
+
+    elif algorithm is Algorithm.SHA256:
+        return sha256()
+
+    elif algorithm is Algorithm.BLAKE2B:
+        return blake2b()
+
+    # TODO: Support IPFS CIDv0 & CIDv1
+    # TODO: Support keccak256 (if even necessary, mentioned in EIP but not used)
+    # TODO: Explore other algorithms needed
+    else:
+        raise ValueError(f"Unsupported algorithm '{algorithm}'.")
 
 
 def compute_checksum(content: bytes, algorithm: Algorithm = Algorithm.MD5) -> HexStr:
@@ -34,23 +66,60 @@ def compute_checksum(content: bytes, algorithm: Algorithm = Algorithm.MD5) -> He
         :class:`~ethpm_types.utils.Hex`
     """
 
-    if isinstance(algorithm, str):
-        algorithm = Algorithm(algorithm)
+    hasher = _new_hash(algorithm)
+    hasher.update(content)
+    return HexStr.from_bytes(hasher.digest())
 
-    if algorithm is Algorithm.MD5:
-        return HexStr.from_bytes(md5(content).digest())
 
-    elif algorithm is Algorithm.SHA3:
-        return HexStr.from_bytes(sha3_256(content).digest())
+def compute_file_checksum(path: Path, algorithm: Algorithm = Algorithm.MD5) -> HexStr:
+    """
+    Calculate the checksum of the given file without reading it into memory
+    all at once.
 
-    elif algorithm is Algorithm.SHA256:
-        return HexStr.from_bytes(sha256(content).digest())
+    Args:
+        path (pathlib.Path): The file to hash.
+        algorithm (:class:`~ethpm_types.utils.Algorithm`): The algorithm to use.
 
-    # TODO: Support IPFS CIDv0 & CIDv1
-    # TODO: Support keccak256 (if even necessary, mentioned in EIP but not used)
-    # TODO: Explore other algorithms needed
-    else:
-        raise ValueError(f"Unsupported algorithm '{algorithm}'.")
+    Returns:
+        :class:`~ethpm_types.utils.Hex`
+    """
+
+    hasher = _new_hash(algorithm)
+    with open(path, "rb") as file:
+        while chunk := file.read(_CHECKSUM_CHUNK_SIZE):
+            hasher.update(chunk)
+
+    return HexStr.from_bytes(hasher.digest())
+
+
+def compute_checksums(
+    contents: Mapping[str, bytes], algorithm: Algorithm = Algorithm.MD5
+) -> dict[str, HexStr]:
+    """
+    Calculate the checksums of many contents at once, such as all the sources
+    of a package. ``hashlib`` releases the GIL while hashing large buffers,
+    so large enough contents are hashed in parallel threads.
+
+    Args:
+        contents (Mapping[str, bytes]): Content to hash by an ID, such as the source ID.
+        algorithm (:class:`~ethpm_types.utils.Algorithm`): The algorithm to use.
+
+    Returns:
+        Dict[str, :class:`~ethpm_types.utils.Hex`]
+    """
+
+    # NOTE: Only buffers larger than ~2 KiB release the GIL, and starting threads
+    #   costs more than hashing small contents, so only use threads for large inputs.
+    if len(contents) < 2 or sum(map(len, contents.values())) < _PARALLEL_CHECKSUM_MIN_SIZE:
+        return {
+            key: compute_checksum(value, algorithm=algorithm) for key, value in contents.items()
+        }
+
+    with ThreadPoolExecutor() as executor:
+        checksums = executor.map(
+            lambda content: compute_checksum(content, algorithm=algorithm), contents.values()
+        )
+        return dict(zip(contents, checksums))
 
 
 def stringify_dict_for_hash(
@@ -98,20 +167,14 @@ def parse_signature(sig: str) -> tuple[str, list[tuple[str, str, str]], list[str
         A tuple of (name, inputs, outputs) where inputs is a list of tuples of (type, indexed, arg
         name) and outputs is a list of types.
     """
-    outsplit = sig.split(" -> ")
-    std_sig = outsplit[0]
-    outputs_maybe = ""
-    if len(outsplit) > 1:
-        outputs_maybe = outsplit[1]
+    std_sig, _, outputs_maybe = sig.partition(" -> ")
     name, remainder = std_sig.split("(")
-    input_tups = [
-        tuple(y.strip().split(" "))
-        for y in filter(lambda x: x, [x for x in remainder.rstrip(")").split(",")])
-    ]
     inputs = []
-    outputs = []
+    for param in remainder.rstrip(")").split(","):
+        if not param:
+            continue
 
-    for intup in input_tups:
+        intup = tuple(param.strip().split(" "))
         inlen = len(intup)
         if inlen == 1:
             inputs.append((intup[0], "", ""))
@@ -123,9 +186,9 @@ def parse_signature(sig: str) -> tuple[str, list[tuple[str, str, str]], list[str
         else:
             raise ValueError(f'Unexpected parameter format: {" ".join(intup)}')
 
-    if outputs_maybe:
-        for outtyp in outputs_maybe.strip("()").split(","):
-            outputs.append(outtyp.strip())
+    outputs = (
+        [outtyp.strip() for outtyp in outputs_maybe.strip("()").split(",")] if outputs_maybe else []
+    )
 
     return (name, inputs, outputs)
 
@@ -136,6 +199,7 @@ __all__ = [
     "Algorithm",
     "Annotated",
     "compute_checksum",
+    "compute_checksums",
     "CONTENT_ADDRESSED_SCHEMES",
     "SourceLocation",
 ]
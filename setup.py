@@ -76,11 +76,12 @@ setup(
     url="https://github.com/ApeWorX/ethpm-types",
     include_package_data=True,
     install_requires=[
-        "pydantic>=2.4.2,<3",
+        "pydantic>=2.6.0,<3",
         "eth-utils>=2.1.0,<6",
         "py-cid>=0.3.0,<0.4",
         "requests>=2.32.3,<3",
         "eth-pydantic-types>=0.1.0,<0.2",
+        "orjson>=3.8.3,<4",
     ],
     python_requires=">=3.9,<4",
     extras_require=extras_require,
@@ -1,4 +1,5 @@
 import pytest
+from eth_utils import keccak
 
 from ethpm_types.abi import (
     ABIType,
@@ -13,6 +14,10 @@ from ethpm_types.abi import (
 from ethpm_types.contract_type import ABIList
 
 
+def keccak_text(text: str) -> bytes:
+    return keccak(text=text)
+
+
 class TestABIType:
     def test_canonical_type_when_string(self):
         abi = ABIType(name="foo", type="string")
@@ -22,6 +27,59 @@ class TestABIType:
         abi = ABIType(name="foo", type="tuple", components=[ABIType(name="bar", type="string")])
         assert abi.canonical_type == "(string)"
 
+    @pytest.mark.parametrize(
+        "abi_type,expected",
+        [("tuple[]", "(string,uint256)[]"), ("tuple[2][]", "(string,uint256)[2][]")],
+    )
+    def test_canonical_type_when_tuple_array(self, abi_type, expected):
+        components = [ABIType(name="bar", type="string"), ABIType(name="baz", type="uint256")]
+        abi = ABIType(name="foo", type=abi_type, components=components)
+        assert abi.canonical_type == expected
+
+        other = ABIType(name="bar", type=abi_type, components=components)
+        assert other.canonical_type is abi.canonical_type
+
+    def test_canonical_type_when_nested(self):
+        inner = ABIType(type="tuple[]", components=[ABIType(type="address")])
+        abi = ABIType(name="foo", type=ABIType(type=inner))
+        assert abi.canonical_type == "(address)[]"
+        assert abi.signature == "(address)[] foo"
+
+    def test_canonical_type_cached(self):
+        component = ABIType(name="bar", type="string")
+        abi = ABIType(name="foo", type="tuple[]", components=[component])
+        other = ABIType(name="foo", type="tuple[]", components=[component])
+        assert abi.canonical_type == "(string)[]"
+        assert abi.signature == "(string)[] foo"
+        assert "canonical_type" in component.__dict__
+
+        # Cached values must not affect equality or hashing.
+        assert abi == other
+        simple = ABIType(name="foo", type="string")
+        expected = hash(simple)
+        assert simple.canonical_type == "string"
+        assert hash(simple) == expected
+
+    def test_model_copy_clears_cache(self):
+        abi = ABIType(name="x", type="uint256")
+        assert abi.signature == "uint256 x"
+
+        copied = abi.model_copy(update={"type": "address"})
+        assert copied.canonical_type == "address"
+        assert copied.signature == "address x"
+        assert abi.model_copy(update={"name": "y"}).signature == "uint256 y"
+
+        event_abi = EventABIType(name="x", type="uint256")
+        assert event_abi.signature == "uint256 x"
+        assert event_abi.model_copy(update={"indexed": True}).signature == "uint256 indexed x"
+
+    def test_type_interned(self):
+        type_name = "".join(("uint", "256"))
+        abi = ABIType(name="foo", type=type_name, internalType=type_name)
+        other = ABIType.model_validate_json('{"type": "uint256", "internalType": "uint256"}')
+        assert abi.type is other.type
+        assert abi.internal_type is other.internal_type
+
     def test_model_dump(self):
         abi = ABIType(name="foo", type="string", internalType="string")
         actual = abi.model_dump()
@@ -238,3 +296,26 @@ class TestABIList:
         # Show the .get() method works.
         actual = abi_ls.get("transfer")
         assert actual.signature == signature
+
+    def test_lookups_refresh_when_mutated(self):
+        transfer = MethodABI.from_signature("transfer(address to, uint256 value)")
+        approve = MethodABI.from_signature("approve(address spender, uint256 value)")
+        abi_ls = ABIList((transfer,), selector_id_size=4, selector_hash_fn=keccak_text)
+        assert "approve" not in abi_ls
+
+        abi_ls.append(approve)
+        assert abi_ls["approve"] == approve
+        assert abi_ls[approve.selector] == approve
+        assert abi_ls[keccak_text(approve.selector)[:4]] == approve
+
+        abi_ls.remove(approve)
+        assert "approve" not in abi_ls
+        assert keccak_text(approve.selector)[:4] not in abi_ls
+
+    def test_first_match_wins(self):
+        first = MethodABI.from_signature("transfer(address to, uint256 value)")
+        second = MethodABI.from_signature("transfer(address to)")
+        abi_ls = ABIList((first, second))
+        assert abi_ls["transfer"] == first
+        abi_ls.reverse()
+        assert abi_ls["transfer"] == second
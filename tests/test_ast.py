@@ -473,6 +473,28 @@ def test_vy_ast():
     assert node.get_defining_function((55, 11, 56, 14)) is None
 
 
+def test_functions_cached():
+    node = ASTNode.model_validate(VYPER_AST_JSON)
+    functions = node.functions
+    functions.clear()
+    assert len(node.functions) == 1
+
+    node.children = [c for c in node.children if c.ast_type != "FunctionDef"]
+    assert node.functions == []
+
+
+def test_model_copy_clears_children_caches():
+    node = ASTNode.model_validate(VYPER_AST_JSON)
+    idx = SourceMapItem(start=111, length=0, contract_id=None, jump_code="-")
+    assert len(node.functions) == 1
+    assert node.get_node(idx) is not None
+
+    copied = node.model_copy(update={"children": []})
+    assert copied.functions == []
+    assert copied.get_node(idx) is None
+    assert len(node.functions) == 1
+
+
 def test_sol_ast():
     node = ASTNode.model_validate(SOLIDITY_AST_JSON)
     assert node.ast_type == "SourceUnit"
@@ -485,3 +507,31 @@ def test_ast_get_node_no_length(length):
     idx = SourceMapItem(start=111, length=length, contract_id=None, jump_code="-")
     actual = node.get_node(idx)
     assert actual.ast_type == "Int"
+
+
+def test_nested_ast():
+    depth = 50
+    data = {"ast_type": "Module", "src": "0:100:0", "body": []}
+    parent = data
+    for idx in range(depth):
+        child = {"ast_type": "If", "src": f"{idx + 1}:1:0", "body": []}
+        parent["body"].extend((child, {"ast_type": "Pass", "src": f"{idx + 1}:2:0"}))
+        parent = child
+
+    node = ASTNode.model_validate(data)
+    nodes = list(node.iter_nodes())
+    assert len(nodes) == 2 * depth + 1
+    assert [n.ast_type for n in nodes[:4]] == ["Module", "If", "If", "If"]
+    assert nodes[-1].ast_type == "Pass"
+    assert nodes[-1].src.start == 1
+
+    deepest = node.get_node(SourceMapItem(start=depth, length=1, jump_code=""))
+    assert deepest is nodes[depth]
+    assert node.get_nodes_at_line((-1, -1, -1, -1)) == nodes
+    assert node.get_node(SourceMapItem(start=depth, length=3, jump_code="")) is None
+
+    # Serialized nodes carry their children already.
+    assert ASTNode.model_validate(node.model_dump()) == node
+
+    node.children = []
+    assert node.get_node(SourceMapItem(start=depth, length=1, jump_code="")) is None
@@ -1,9 +1,12 @@
+import json
 from typing import Any
 
 import pytest
 from eth_pydantic_types import HexBytes
+from pydantic import ValidationError
 
-from ethpm_types import BaseModel
+from ethpm_types import BaseModel, ContractType, PackageManifest
+from tests.conftest import COMPILED_BASE
 
 
 @pytest.fixture
@@ -28,3 +31,69 @@ def test_model_dump_json(MyModel):
     model = MyModel(name="foo", input_types={"name": [HexBytes(123)]})
     actual = model.model_dump_json()
     assert actual == '{"input_types":{"name":["{"]},"name":"foo"}'
+
+
+def test_model_dump_json_non_ascii(MyModel):
+    model = MyModel(name="föö", input_types={})
+    actual = model.model_dump_json()
+    assert actual == '{"input_types":{},"name":"f\\u00f6\\u00f6"}'
+    assert model.to_canonical_bytes() == actual.encode()
+
+
+def test_model_dump_json_indent(MyModel):
+    model = MyModel(name="foo", input_types={})
+    actual = model.model_dump_json(indent=2, separators=(",", ": "))
+    assert actual == '{\n  "input_types": {},\n  "name": "foo"\n}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    (1e16, 1e-7, 1.5, float("nan"), float("inf"), "del\x7f", "ctrl\x01\n", 2**70, None),
+)
+def test_model_dump_json_matches_json_dumps(value, MyModel):
+    model = MyModel(name="foo", input_types={"value": value})
+    expected = json.dumps(model.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    assert model.model_dump_json() == expected
+    assert model.to_canonical_bytes() == expected.encode()
+
+
+@pytest.mark.parametrize("name", [p.stem for p in COMPILED_BASE.glob("*.json")])
+def test_model_dump_json_matches_json_dumps_fixtures(name):
+    text = (COMPILED_BASE / f"{name}.json").read_text()
+    cls = PackageManifest if "manifest" in json.loads(text) else ContractType
+    model = cls.model_validate_json(text)
+    expected = json.dumps(model.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    assert model.model_dump_json() == expected
+    assert model.to_canonical_bytes() == expected.encode()
+
+
+@pytest.mark.parametrize(
+    "data", ('{"name":"foo","input_types":{"a":1}}', b'{"name":"foo","input_types":{}}')
+)
+def test_model_validate_json(data, MyModel):
+    model = MyModel.model_validate_json(data)
+    assert model.name == "foo"
+
+
+def test_model_validate_json_invalid_json(MyModel):
+    with pytest.raises(ValidationError):
+        MyModel.model_validate_json('{"name": "foo",')
+
+
+@pytest.mark.parametrize("value", (2**64 + 1, -(2**63) - 1, 123456789012345678901234567890))
+def test_model_validate_json_wide_int(value, MyModel):
+    data = f'{{"input_types":{{"runs":{value}}},"name":"foo"}}'
+    for json_data in (data, data.encode()):
+        model = MyModel.model_validate_json(json_data)
+        assert model.input_types["runs"] == value
+        assert isinstance(model.input_types["runs"], int)
+        assert model.model_dump_json() == data
+
+
+def test_model_validate_json_strict():
+    class StrictModel(BaseModel):
+        data: bytes
+
+    # NOTE: JSON mode accepts strings for bytes even when strict.
+    model = StrictModel.model_validate_json('{"data":"abc"}', strict=True)
+    assert model.data == b"abc"
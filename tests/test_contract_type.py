@@ -1,9 +1,9 @@
 import pytest
-from eth_pydantic_types import HexStr
+from eth_pydantic_types import HexBytes, HexStr
 from eth_utils import keccak
 
-from ethpm_types import ContractType
-from ethpm_types.abi import ABI, ErrorABI, EventABI, MethodABI
+from ethpm_types import Bytecode, ContractType
+from ethpm_types.abi import ABI, ConstructorABI, ErrorABI, EventABI, MethodABI, UnprocessedABI
 
 MUTABLE_METHOD_SELECTOR_BYTES = keccak(text="setNumber(uint256)")
 VIEW_METHOD_SELECTOR_BYTES = keccak(text="getStruct()")
@@ -196,6 +196,14 @@ def test_select_by_slice(oz_contract_type):
     assert mutables == ["grantRole", "renounceRole"]
 
 
+def test_select_by_unsupported_type(vyper_contract):
+    with pytest.raises(NotImplementedError):
+        _ = vyper_contract.events[1.5]
+
+    with pytest.raises(NotImplementedError):
+        _ = 1.5 in vyper_contract.events
+
+
 def test_contract_type_excluded_in_repr_abi(vyper_contract):
     actual = repr(vyper_contract.events[0])
     assert "contract_type" not in actual
@@ -232,6 +240,23 @@ def test_repr(vyper_contract):
     assert repr(vyper_contract) == "<ContractType>"
 
 
+def test_bytecode_repr():
+    bytecode = Bytecode(bytecode="0x6080604052348015600f57600080fd")
+    expected = "Bytecode(bytecode='0x608...0fd', link_references=None, link_dependencies=None)"
+    assert repr(bytecode) == expected
+    assert repr(Bytecode(bytecode="0x6080")) == (
+        "Bytecode(bytecode='0x6080', link_references=None, link_dependencies=None)"
+    )
+
+
+def test_bytecode_str():
+    bytecode = Bytecode(bytecode="0x6080604052348015600f57600080fd")
+    expected = (
+        "bytecode='0x6080604052348015600f57600080fd' link_references=None link_dependencies=None"
+    )
+    assert str(bytecode) == expected
+
+
 def test_solidity_fallback_and_receive(solidity_fallback_and_receive_contract):
     """
     Ensure we can detect the fallback and receive methods when they are defined.
@@ -269,6 +294,15 @@ def test_init_bytecode_using_bytes(contract):
     assert new_contract.deployment_bytecode.bytecode == raw_bytes
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [("0x60AB", "0x60ab"), ("0x6", "0x06"), ("60ab", "0x60ab"), (b"\x60\xab", "0x60ab")],
+)
+def test_init_bytecode_normalizes(value, expected):
+    new_contract = ContractType(abi=[], deploymentBytecode={"bytecode": value})
+    assert new_contract.deployment_bytecode.bytecode == expected
+
+
 def test_init_bytecode_using_empty_dict(contract):
     new_contract = ContractType(abi=[], deploymentBytecode={})
     assert new_contract.deployment_bytecode.bytecode is None
@@ -376,6 +410,25 @@ def test_get_deployment_bytecode_no_code(vyper_contract):
     assert actual is None
 
 
+def test_bytecode_to_bytes_cached():
+    bytecode = Bytecode(bytecode="0x6001")
+    actual = bytecode.to_bytes()
+    assert actual == b"\x60\x01"
+    assert bytecode.to_bytes() is actual
+    assert bytecode == Bytecode(bytecode="0x6001")
+
+    bytecode.bytecode = "0x6002"
+    assert bytecode.to_bytes() == b"\x60\x02"
+
+    copied = bytecode.model_copy(update={"bytecode": "0x6003"})
+    assert copied.to_bytes() == b"\x60\x03"
+    assert bytecode.to_bytes() == b"\x60\x02"
+
+    # Assigned values are not validated.
+    bytecode.bytecode = "603"
+    assert bytecode.to_bytes() == HexBytes("0x0603")
+
+
 def test_natspecs(contract):
     actual = contract.natspecs["setNumber(uint256)"]
     expected_header = (
@@ -404,3 +457,66 @@ def test_natspecs_solidity(solidity_contract):
     actual_error = solidity_contract.natspecs["ACustomError()"]
     expected_error = "@details This is a doc for an error"
     assert actual_error == expected_error
+
+
+def test_abi_selections_refresh_when_abi_changes(vyper_contract):
+    events = vyper_contract.events
+    assert len(events) > 0
+
+    copied = vyper_contract.model_copy(update={"abi": []})
+    assert len(copied.events) == 0
+    assert len(copied.methods) == 0
+    assert copied.method_identifiers == {}
+    assert len(vyper_contract.events) == len(events)
+
+    vyper_contract.abi = []
+    assert len(vyper_contract.events) == 0
+    assert len(vyper_contract.view_methods) == 0
+
+
+def test_abi_selections_are_not_shared(vyper_contract):
+    events = vyper_contract.events
+    events.clear()
+    assert len(vyper_contract.events) > 0
+
+
+def test_eq_and_hash(vyper_contract, solidity_contract):
+    copy = vyper_contract.model_copy(deep=True)
+    assert copy is not vyper_contract
+    assert copy == vyper_contract
+    assert hash(copy) == hash(vyper_contract)
+    assert len({vyper_contract, copy, solidity_contract}) == 2
+
+    copy.abi = copy.abi[:-1]
+    assert copy != vyper_contract
+
+
+def test_abi_selections_include_subclasses():
+    class CustomEventABI(EventABI):
+        pass
+
+    event = CustomEventABI(name="Custom", inputs=[])
+    contract = ContractType(abi=[])
+    contract.abi = [event]
+    assert contract.events == [event]
+    assert contract.methods == []
+
+
+def test_abi_validation_falls_back_to_unprocessed():
+    abi = [
+        {"type": "event", "name": "Transfer", "inputs": [], "anonymous": False},
+        {"type": "function", "inputs": []},  # Missing `name`.
+        {"type": "custom", "foo": "bar"},
+    ]
+    contract = ContractType(abi=abi)
+    assert [type(x) for x in contract.abi] == [EventABI, UnprocessedABI, UnprocessedABI]
+
+
+def test_abi_validation_without_type():
+    abi = [
+        {"name": "foo", "inputs": [], "outputs": [], "stateMutability": "view"},
+        {"stateMutability": "payable"},  # Not a valid function.
+    ]
+    contract = ContractType(abi=abi)
+    assert [type(x) for x in contract.abi] == [MethodABI, ConstructorABI]
+    assert contract.view_methods[0].name == "foo"
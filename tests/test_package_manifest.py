@@ -151,6 +151,12 @@ def test_getattr(package_manifest, solidity_contract):
         _ = package_manifest.contractTypes
 
 
+def test_getattr_without_contract_types():
+    manifest = PackageManifest.model_construct()
+    with pytest.raises(AttributeError):
+        _ = manifest.SolidityContract
+
+
 def test_get_contract_type(package_manifest, solidity_contract):
     actual = package_manifest.get_contract_type("SolidityContract")
     expected = solidity_contract
@@ -198,6 +204,22 @@ def test_package_name_using_all_valid_characters():
     assert manifest.name == name
 
 
+@pytest.mark.parametrize(
+    "name,message",
+    [
+        ("", "Length must be between 1 and 255"),
+        ("a" * 256, "Length must be between 1 and 255"),
+        ("1abc", "First character in name must be a-z"),
+        ("my_token", "Characters in name must be one of a-z or 0-9 or '-'"),
+        ("my-Token", "Characters in name must be one of a-z or 0-9 or '-'"),
+        ("my-token\n", "Characters in name must be one of a-z or 0-9 or '-'"),
+    ],
+)
+def test_package_name_invalid(name, message):
+    with pytest.raises(ValidationError, match=message):
+        PackageManifest(name=name, version="0.1.0")
+
+
 def test_get_compiler():
     compiler = Compiler(name="vyper", version="0.3.7", settings={}, contractTypes=["foobar"])
     manifest = PackageManifest(
@@ -232,6 +254,30 @@ def test_add_compilers():
     manifest.add_compilers(*new_compilers)
     assert len(manifest.compilers) == 2
 
+    # Duplicates within the given compilers are only added once.
+    duplicates = [Compiler(name="solc", version="0.8.20", settings={}) for _ in range(2)]
+    manifest.add_compilers(*duplicates)
+    assert len(manifest.compilers) == 3
+
+
+def test_compiler_lookups_refresh_when_compilers_change():
+    compiler = Compiler(name="vyper", version="0.3.7", settings={}, contractTypes=["foobar"])
+    manifest = PackageManifest(compilers=[compiler])
+    assert manifest.get_compiler("Vyper", "0.3.7") == compiler
+    assert manifest.get_contract_compiler("testtest") is None
+
+    new_compiler = Compiler(name="vyper", version="0.3.10", settings={}, contractTypes=["testtest"])
+    manifest.add_compilers(new_compiler)
+    assert manifest.get_compiler("vyper", "0.3.10") == new_compiler
+    assert manifest.get_contract_compiler("testtest") == new_compiler
+
+    copied = manifest.model_copy(update={"compilers": [compiler]})
+    assert copied.get_contract_compiler("testtest") is None
+    assert manifest.get_contract_compiler("testtest") == new_compiler
+
+    manifest.compilers = None
+    assert manifest.get_compiler("vyper", "0.3.7") is None
+
 
 def test_contract_types():
     """
@@ -316,3 +362,12 @@ def test_model_dump_source_with_none_checksum():
     assert "sources" in actual
     assert "checksum" not in actual["sources"]
     assert actual["sources"]["this_is_a_source_id"]["content"] == "I am a source!\n"
+
+
+@pytest.mark.parametrize(
+    "contract_type",
+    (ContractType(sourceId="missing.sol"), {"sourceId": "missing.sol"}),
+)
+def test_contract_type_source_id_missing_from_sources(contract_type):
+    with pytest.raises(ValidationError, match="'missing.sol' missing from `sources`"):
+        PackageManifest(contract_types={"Foo": contract_type}, sources={"a.sol": "contract"})
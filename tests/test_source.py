@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 from pydantic import FileUrl
 
+from ethpm_types import PackageManifest
 from ethpm_types.source import Checksum, Compiler, Content, ContractSource, Source
 from ethpm_types.utils import Algorithm, compute_checksum
 
@@ -350,3 +351,13 @@ def test_model_validate_empty_str():
     """
     source = Source.model_validate("")
     assert isinstance(source, Source)
+
+
+@pytest.mark.parametrize("content", ("", "foo\n", "foo\nbar"))
+def test_model_dump_content(content):
+    source = Source(content=content)
+    expected = str(source.content)
+    assert source.model_dump()["content"] == expected
+    # Nested (such as in a manifest) dumps the same.
+    manifest = PackageManifest(sources={"source.txt": source})
+    assert manifest.model_dump()["sources"]["source.txt"] == source.model_dump()
@@ -104,3 +104,34 @@ def test_repr_and_str():
     sourcemap_obj = SourceMap(root=sourcemap)
     assert repr(sourcemap_obj) == sourcemap
     assert str(sourcemap_obj) == sourcemap
+
+
+@pytest.mark.parametrize(
+    "sourcemap", ["0:10:0:-;;5:3:0;:::o;1::", "1:2:3:i:1;;-1:4;:0:-1:o", "", ";;4"]
+)
+def test_parse_matches_parse_str(sourcemap):
+    expected = []
+    item = None
+    for row in sourcemap.split(";"):
+        item = SourceMapItem.parse_str(row, previous=item)
+        expected.append(item)
+
+    assert list(SourceMap(root=sourcemap).parse()) == expected
+
+
+@pytest.mark.parametrize("sourcemap_filename", SOURCE_MAP_FILES)
+def test_at(sourcemap_filename):
+    sourcemap = SOURCE_MAP_FILES[sourcemap_filename].read_text().strip()
+    # Repeat the map so it spans several checkpoints.
+    sourcemap_obj = SourceMap(root=";".join([sourcemap] * 3))
+    expected = list(sourcemap_obj.parse())
+    for index in (0, 1, 255, 256, 257, len(expected) // 2, len(expected) - 1):
+        assert sourcemap_obj.at(index) == expected[index]
+
+    assert sourcemap_obj.at(-1) == expected[-1]
+    with pytest.raises(IndexError):
+        sourcemap_obj.at(len(expected))
+
+    # Changing the map resets the checkpoints.
+    sourcemap_obj.root = "1:2:3:-"
+    assert sourcemap_obj.at(0) == SourceMapItem.parse_str("1:2:3:-")
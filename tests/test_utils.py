@@ -1,7 +1,38 @@
-from ethpm_types.utils import compute_checksum
+from hashlib import blake2b
+
+import pytest
+
+from ethpm_types.utils import Algorithm, compute_checksum, compute_checksums, compute_file_checksum
 
 
 def test_compute_checksum():
     content = b"this is content"
     actual = compute_checksum(content)
     assert actual.startswith("0x")
+
+
+def test_compute_checksum_blake2b():
+    content = b"this is content"
+    actual = compute_checksum(content, algorithm=Algorithm.BLAKE2B)
+    assert actual == f"0x{blake2b(content).hexdigest()}"
+
+
+def test_compute_file_checksum(tmp_path):
+    content = b"this is content" * 100_000
+    file = tmp_path / "content.txt"
+    file.write_bytes(content)
+    for algorithm in Algorithm:
+        actual = compute_file_checksum(file, algorithm=algorithm)
+        assert actual == compute_checksum(content, algorithm=algorithm)
+
+
+@pytest.mark.parametrize("size", (1, 10_000))
+def test_compute_checksums(size):
+    # NOTE: Large contents are hashed in threads; small ones inline.
+    contents = {f"source_{i}.sol": f"contract C{i} {{}}".encode() * size for i in range(8)}
+    actual = compute_checksums(contents, algorithm=Algorithm.SHA256)
+    assert list(actual) == list(contents)
+    for source_id, content in contents.items():
+        assert actual[source_id] == compute_checksum(content, algorithm=Algorithm.SHA256)
+
+    assert compute_checksums({}) == {}